@@ -3,21 +3,24 @@
 
 from distutils.core import setup as core_setup
 
-from Cython.Build import cythonize
-
 from setuptools import find_packages, setup
 
+try:
+	from Cython.Build import cythonize
+except ImportError:
+	cythonize = None
+
 setup(
 	name="Scheduling Solver",
 	version="0.2.0-alpha",
-	packages=find_packages(),
+	packages=find_packages(where="src"),
 	scripts=['say_hello.py'],
 
 	# Project uses reStructuredText, so ensure that the docutils get
 	# installed or upgraded on the target machine
 	install_requires=['docutils>=0.3'],
 
-	python_requires="3.7",
+	python_requires=">=3.7",
 	package_dir={'': 'src'},
 	test_suite='your.module.tests',
 
@@ -35,7 +38,8 @@ setup(
 	classifiers=[
 		'License :: OSI Approved :: Python Software Foundation License',
 	],
-	ext_modules=cythonize("hello.pyx"),
+	# compile the problem builder when Cython is available, the pure Python module is used otherwise
+	ext_modules=cythonize(["src/builder.py"], language_level=3) if cythonize else [],
 
 	# could also include long_description, download_url, etc.
 )
@@ -0,0 +1,11 @@
+# cython: language_level=3
+
+# Declarations augmenting builder.py when it is compiled with Cython, the pure Python module is left unchanged.
+
+
+cdef class _ArchTarget:
+	cdef public list cpus
+
+
+cdef class _GraphTarget:
+	cdef public list nodes
@@ -1,26 +1,230 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+"""
+Threat model
+	The *.tsk* and *.cfg* files are expected to come from trusted tooling, such as the bundled test cases.
+	They are parsed by lxml (libxml2) rather than `defusedxml`, whose checks run in Python on every element.
+	The same protections are enforced at the C level instead: entities are not resolved (no XXE or entity expansion),
+	no network access is allowed (no external DTD), and the libxml2 limits on tree depth and text size are kept.
+"""
+
 # IMPORTS #############################################################################################################
 
 
 import logging
+from array import array
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
+from typing import Any, List, Mapping, NoReturn, Optional, Tuple
 
 from datatypes import Architecture, Core, FilepathPair, Graph, Node, Problem, Processor
 
-from defusedxml import ElementTree
+from lxml import etree
 
-from ortools.sat.python.cp_model import CpModel
+from ortools.sat.python.cp_model import CpModel, IntVar
 
 from timed import timed_callable
 
 
+# CONSTANTS ###########################################################################################################
+
+
+"""Options shared by the importers' parsers, see the threat model in the module docstring."""
+_PARSER_OPTIONS = {"resolve_entities": False, "no_network": True, "huge_tree": False}
+
+
+# CLASSES #############################################################################################################
+
+
+class _ArchTarget:
+	"""A parser target collecting the macroticks of the cores of each processor from a configuration file.
+
+	Attributes
+	----------
+	cpus : List[Tuple[int, List[Tuple[int, Optional[int]]]]]
+		The `Id` of each `Cpu` element, along with the `Id` and macrotick of each of its `Core` elements.
+
+	Methods
+	-------
+	start(tag, attrib)
+		Reads the attributes of a `Cpu` or `Core` start tag.
+	close()
+		Returns the macroticks of the cores of each processor, both ordered by `Id`.
+	"""
+
+	def __init__(self: Any) -> NoReturn:
+		"""Initializes the target with no processor."""
+
+		self.cpus = []
+
+	def start(self: Any, tag: str, attrib: Mapping[str, str]) -> NoReturn:
+		"""Reads the attributes of a `Cpu` or `Core` start tag, and ignores all the others.
+
+		Parameters
+		----------
+		tag : str
+			The name of the element.
+		attrib : Mapping[str, str]
+			The attributes of the element.
+		"""
+
+		if tag == "Core":
+			macrotick = attrib["MacroTick"]
+			self.cpus[-1][1].append((int(attrib["Id"]), None if macrotick == "9999999" else int(macrotick)))
+		elif tag == "Cpu":
+			self.cpus.append((int(attrib["Id"]), []))
+
+	def close(self: Any) -> Tuple[Tuple[Optional[int], ...], ...]:
+		"""Returns the macroticks of the cores of each processor, both ordered by `Id`.
+
+		Returns
+		-------
+		Tuple[Tuple[Optional[int], ...], ...]
+			The macroticks of the cores of each processor.
+		"""
+
+		return tuple(tuple(macrotick for _, macrotick in _in_id_order(cores)) for _, cores in _in_id_order(self.cpus))
+
+
+class _GraphTarget:
+	"""A parser target collecting the attributes of each task from a tasks file.
+
+	Attributes
+	----------
+	nodes : List[tuple]
+		The `Id` of each `Node` element, followed by its attributes in the order of the `Node` fields following `id`.
+
+	Methods
+	-------
+	start(tag, attrib)
+		Reads the attributes of a `Node` start tag.
+	close()
+		Returns the attributes of each task, ordered by `Id`.
+	"""
+
+	def __init__(self: Any) -> NoReturn:
+		"""Initializes the target with no task."""
+
+		self.nodes = []
+
+	def start(self: Any, tag: str, attrib: Mapping[str, str]) -> NoReturn:
+		"""Reads the attributes of a `Node` start tag, and ignores all the others.
+
+		Parameters
+		----------
+		tag : str
+			The name of the element.
+		attrib : Mapping[str, str]
+			The attributes of the element.
+		"""
+
+		if tag != "Node":
+			return
+
+		max_jitter = attrib["MaxJitter"]
+		core_id = attrib["CoreId"]
+		self.nodes.append((
+			int(attrib["Id"]),
+			attrib["Name"],
+			int(attrib["WCET"]),
+			int(attrib["Period"]),
+			int(attrib["Deadline"]),
+			None if max_jitter == "-1" else int(max_jitter),
+			int(attrib["Offset"]),
+			int(attrib["CpuId"]),
+			None if core_id == "-1" else int(core_id),
+		))
+
+	def close(self: Any) -> Tuple[tuple, ...]:
+		"""Returns the attributes of each task, ordered by `Id`.
+
+		Returns
+		-------
+		Tuple[tuple, ...]
+			The attributes of each task, in the order of the `Node` fields following `id`.
+		"""
+
+		return tuple(fields for _, *fields in _in_id_order(self.nodes))
+
+
 # FUNCTIONS ###########################################################################################################
 
 
+def _in_id_order(pairs: List[tuple]) -> List[tuple]:
+	"""Orders pairs of an id and a value by id, only sorting them if they are not already in order.
+
+	Parameters
+	----------
+	pairs : List[tuple]
+		A list of tuples whose first member is an `int` id.
+
+	Returns
+	-------
+	List[tuple]
+		The same list if it is already ordered by id, and a sorted copy of it otherwise.
+	"""
+
+	if all(previous[0] <= current[0] for previous, current in zip(pairs, islice(pairs, 1, None))):
+		return pairs
+
+	return sorted(pairs, key=itemgetter(0))
+
+
+@lru_cache(maxsize=128)
+def _read_arch(filepath: str, mtime: int, size: int) -> Tuple[Tuple[Optional[int], ...], ...]:
+	"""Reads the macroticks of the cores of each processor from a configuration file.
+	The values are collected by a parser target as the start tags are parsed, so no element tree is ever built.
+	Results are cached, the modification time and size of the file being part of the key so that changes invalidate it.
+
+	Parameters
+	----------
+	filepath : str
+		A path to a *.cfg* file describing the processor architecture.
+	mtime : int
+		The modification time of the file, in nanoseconds.
+	size : int
+		The size of the file, in bytes.
+
+	Returns
+	-------
+	Tuple[Tuple[Optional[int], ...], ...]
+		The macroticks of the cores of each processor, both ordered by `Id`.
+	"""
+
+	return etree.parse(filepath, etree.XMLParser(target=_ArchTarget(), **_PARSER_OPTIONS))
+
+
+@lru_cache(maxsize=128)
+def _read_graph(filepath: str, mtime: int, size: int) -> Tuple[tuple, ...]:
+	"""Reads the attributes of each task from a tasks file.
+	The values are collected by a parser target as the start tags are parsed, so no element tree is ever built.
+	Results are cached, the modification time and size of the file being part of the key so that changes invalidate it.
+
+	Parameters
+	----------
+	filepath : str
+		A path to a *.tsk* file describing the task graph.
+	mtime : int
+		The modification time of the file, in nanoseconds.
+	size : int
+		The size of the file, in bytes.
+
+	Returns
+	-------
+	Tuple[tuple, ...]
+		The attributes of each task, in the order of the `Node` fields following `id`, ordered by `Id`.
+	"""
+
+	return etree.parse(filepath, etree.XMLParser(target=_GraphTarget(), **_PARSER_OPTIONS))
+
+
 def _import_arch(filepath: Path) -> Architecture:
 	"""Create the processor architecture from the configuration file, then returns it.
+	The file is only parsed again if it has changed since the last call, but new objects are created on each call,
+	so the returned architecture can be freely modified.
 
 	Parameters
 	----------
@@ -33,24 +237,18 @@ def _import_arch(filepath: Path) -> Architecture:
 		An iterable of `Processor`.
 	"""
 
+	stat = filepath.stat()
+
 	return [
-		Processor(
-			i,
-			(0.0, None),
-			[
-				Core(
-					ii,
-					int(core.get("MacroTick")) if int(core.get("MacroTick")) != 9999999 else None,
-					0.0,
-					[],
-				) for ii, core in enumerate(sorted(cpu, key=lambda e: int(e.get("Id"))))
-			],
-		) for i, cpu in enumerate(sorted(ElementTree.parse(filepath).iter("Cpu"), key=lambda e: int(e.get("Id"))))
+		Processor(i, (0, None), [Core(ii, macrotick, 0, array("q")) for ii, macrotick in enumerate(macroticks)])
+		for i, macroticks in enumerate(_read_arch(str(filepath), stat.st_mtime_ns, stat.st_size))
 	]
 
 
 def _import_graph(filepath: Path) -> Graph:
 	"""Creates the graph from the tasks file, then returns it.
+	The file is only parsed again if it has changed since the last call, but new objects are created on each call,
+	so the returned graph can be freely modified.
 
 	Parameters
 	----------
@@ -63,30 +261,35 @@ def _import_graph(filepath: Path) -> Graph:
 		An iterable of `Node`.
 	"""
 
-	return [
-		Node(
-			i,
-			node.get("Name"),
-			int(node.get("WCET")),
-			int(node.get("Period")),
-			int(node.get("Deadline")),
-			int(node.get("MaxJitter")) if int(node.get("MaxJitter")) != -1 else None,
-			int(node.get("Offset")),
-			int(node.get("CpuId")),
-			int(node.get("CoreId")) if int(node.get("CoreId")) != -1 else None,
-		) for i, node in enumerate(sorted(ElementTree.parse(filepath).iter("Node"), key=lambda e: int(e.get("Id"))))
-	]
+	stat = filepath.stat()
+
+	return [Node(i, *fields) for i, fields in enumerate(_read_graph(str(filepath), stat.st_mtime_ns, stat.st_size))]
+
 
+def _create_variables(model: CpModel, graph: Graph, arch: Architecture) -> List[IntVar]:
+	"""Creates the core assignment variables of the unassigned tasks in the model, then returns them.
 
-def _create_variables(model: CpModel, graph: Graph, arch: Architecture) -> NoReturn:
+	Parameters
+	----------
+	model : CpModel
+		A `CpModel` to which the variables are added.
+	graph : Graph
+		A `Graph` containing the tasks.
+	arch : Architecture
+		An `Architecture` giving the number of cores of each `Processor`.
 
-	model.NewIntVar(
-		0,
-		len(arch[node.cpu_id].cores) - 1,
-		"task[" + node.id + "].core_id"
-	) for node in graph if node.core_id is None
+	Returns
+	-------
+	List[IntVar]
+		The core id variable of each `Node` whose `core_id` is `None`.
+	"""
 
+	new_int_var = model.NewIntVar
+	upper_bounds = [len(cpu.cores) - 1 for cpu in arch]
 
+	return [
+		new_int_var(0, upper_bounds[node.cpu_id], f"task[{node.id}].core_id") for node in graph if node.core_id is None
+	]
 
 
 def _create_constraints(model: CpModel, graph: Graph, arch: Architecture) -> NoReturn:
@@ -120,15 +323,15 @@ def build(filepath_pair: FilepathPair) -> Problem:
 	"""
 
 	graph = _import_graph(filepath_pair.tsk)
-	logging.info("Imported graphs from " + filepath_pair.tsk.name)
+	logging.info("Imported graphs from %s", filepath_pair.tsk.name)
 
 	arch = _import_arch(filepath_pair.cfg)
-	logging.info("Imported architecture from " + filepath_pair.cfg.name)
+	logging.info("Imported architecture from %s", filepath_pair.cfg.name)
 
 	model = CpModel()
 
 	_create_variables(model, graph, arch)
-	_create_constraints(model, arch, graph)
+	_create_constraints(model, graph, arch)
 	_add_objective_function(model)
 	logging.info("Model created")
 
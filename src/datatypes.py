@@ -4,12 +4,11 @@
 # IMPORTS #############################################################################################################
 
 
-from dataclasses import dataclass, field
+from array import array
 from fractions import Fraction
 from json import JSONEncoder
 from pathlib import Path
-from queue import PriorityQueue
-from typing import Any, Iterable, NamedTuple, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, NoReturn, Optional, Union
 
 from ortools.sat.python.cp_model import CpModel
 
@@ -21,6 +20,7 @@ from recordclass import RecordClass
 
 class Slice(RecordClass):
 	"""Named tuple representing an execution slice of a task.
+	The slices of a `Core` are stored flat in an array in the order of these fields, see `iter_slices`.
 
 	Attributes
 	----------
@@ -28,13 +28,13 @@ class Slice(RecordClass):
 		The reference to the task.
 	start : int
 		The start time of the slice.
-	end : int
-		The end time of the slice.
+	duration : int
+		The duration of the slice.
 	"""
 
 	task_id: int
 	start: int
-	end: int
+	duration: int
 
 
 class Core(RecordClass):
@@ -46,16 +46,36 @@ class Core(RecordClass):
 		The core id within a `Processor`.
 	macrotick : Optional[int]
 		The macrotick of the core.
-	workload : Fraction
-		The workload carried by the `Node` objects in `slices`.
-	slices : Iterable[Slice] (can be empty)
-		The execution slices of the `Node` objects scheduled on this core.
+	workload : int
+		The workload carried by the `Node` objects in `slices`, scaled by the hyperperiod of the `Graph`.
+	slices : array (can be empty)
+		The execution slices of the `Node` objects scheduled on this core, as a flat `array` of signed 64-bit integers
+		holding the fields of each `Slice` one after the other, see `iter_slices`.
+
+	Methods
+	-------
+	__repr__()
+		Returns a representation of the core, in which the slices are shown as `Slice` objects.
 	"""
 
 	id: int
 	macrotick: Optional[int]
-	workload: Fraction
-	slices: Iterable[Slice]
+	workload: int
+	slices: array
+
+	def __repr__(self: Any) -> str:
+		"""Returns a representation of the core, in which the slices are shown as `Slice` objects.
+
+		Returns
+		-------
+		str
+			A `str` representing the core.
+		"""
+
+		return (
+			f"Core(id={self.id!r}, macrotick={self.macrotick!r}, workload={self.workload!r}, "
+			f"slices={list(iter_slices(self))!r})"
+		)
 
 
 class Processor(RecordClass):
@@ -65,9 +85,10 @@ class Processor(RecordClass):
 	----------
 	id : int
 		The processor within an `Architecture`.
-	workload : Tuple[Fraction, PriorityQueue] (PriorityQueue contains core ids, should be: ref(core))
-		A tuple containing the workload carried by the eventual `Node` objects scheduled on the cores of this processor,
-		and a priority queue of `Core` ids by ascending order of workload.
+	workload : Tuple[int, List[PrioritizedItem]] (PrioritizedItem contains core ids, should be: ref(core))
+		A tuple containing the workload carried by the eventual `Node` objects scheduled on the cores of this processor
+		(scaled by the hyperperiod of the `Graph`),
+		and a heap (to be used with `heapq`) of `Core` ids by ascending order of workload.
 	cores : Iterable[Core]
 		The iterable containing the `Core` objects within the Processor.
 	"""
@@ -175,34 +196,89 @@ class Solution(RecordClass):
 	arch: Architecture
 
 
+class PrioritizedItem:
+	"""An element of a priority queue managed with `heapq`, ordered by priority only.
+
+	Attributes
+	----------
+	priority : Union[int, Fraction]
+		The priority of the element, either a scaled workload as an `int` or a node stress as a `Fraction`.
+	item : Any
+		The data carried by the element. This field is not taken into account for the prioritization.
+
+	Methods
+	-------
+	__lt__(other)
+		Compares the priorities of two elements, which is all `heapq` needs.
+	"""
+
+	__slots__ = ("priority", "item")
+
+	def __init__(self: Any, priority: Union[int, Fraction], item: Any) -> NoReturn:
+		self.priority = priority
+		self.item = item
+
+	def __lt__(self: Any, other: Any) -> bool:
+		return self.priority < other.priority
+
+	def __repr__(self: Any) -> str:
+		return f"PrioritizedItem(priority={self.priority!r}, item={self.item!r})"
+
+
 class PriorityQueueEncoder(JSONEncoder):
-	"""An encoder dedicated to parse `PriorityQueue` objects into JSON.
+	"""An encoder dedicated to parse the items of priority queues into JSON.
+
+	Attributes
+	----------
+	_serializers : Dict[type, Callable[[Any], Any]]
+		The serializer of each supported type. Types are matched exactly, with a single lookup instead of `isinstance`.
 
 	Methods
 	-------
 	default(obj)
-		Returns a list containing the size of the `PriorityQueue` and a boolean whether it is empty or not.
+		Returns a list containing the priority and the data of a `PrioritizedItem`,
+		or the numerator and the denominator of a `Fraction`.
+		Records are returned as dictionaries of their fields, the slices of a `Core` as a list of `Slice`,
+		and paths as strings.
 	"""
 
+	_serializers: Dict[type, Callable[[Any], Any]] = {
+		PrioritizedItem: lambda obj: [obj.priority, obj.item],
+		Fraction: lambda obj: [obj.numerator, obj.denominator],
+		Slice: lambda obj: obj._asdict(),
+		Core: lambda obj: {**obj._asdict(), "slices": list(iter_slices(obj))},
+		Processor: lambda obj: obj._asdict(),
+		Node: lambda obj: obj._asdict(),
+		Solution: lambda obj: obj._asdict(),
+		FilepathPair: list,
+		type(Path()): str,
+	}
+
 	def default(self: JSONEncoder, obj: Any) -> Any:
-		if isinstance(obj, PriorityQueue):
-			return [obj.qsize(), obj.empty()]
+		serializer = self._serializers.get(type(obj))
+		if serializer is not None:
+			return serializer(obj)
 		# Let the base class default method raise the TypeError
 		return JSONEncoder.default(self, obj)
 
 
-@dataclass(order=True)
-class PrioritizedItem:
-	"""An encoder dedicated to parse `PriorityQueue` objects into JSON.
+# FUNCTIONS ###########################################################################################################
 
-	Attributes
+
+def iter_slices(core: Core) -> Iterator[Slice]:
+	"""Iterates over the execution slices of a core.
+
+	Parameters
 	----------
-	priority : Fraction
-		The prioroty of the element as a `Fraction`.
-	item : Any
-		The data carried by the element. This field is not taken into account for the prioritization.
-		(default: `field(compare=False)`)
+	core : Core
+		A `Core`.
+
+	Returns
+	-------
+	Iterator[Slice]
+		An iterator over the `Slice` objects of the core, in scheduling order.
 	"""
 
-	priority: Fraction
-	item: Any = field(compare=False)
+	it = iter(core.slices)
+
+	return map(Slice, it, it, it)
@@ -6,24 +6,79 @@
 
 from enum import Enum, unique
 from functools import partial
+from io import StringIO
 from json import dumps
 from pathlib import Path
-from typing import Any
-from xml.etree.ElementTree import Element, SubElement, fromstringlist, tostring  # noqa:S405
+from typing import Any, Callable, Dict
+from xml.sax.saxutils import escape
 
 from datatypes import PriorityQueueEncoder, Solution
 
-from defusedxml.minidom import parseString
-
 from timed import timed_callable
 
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+# CONSTANTS ###########################################################################################################
+
+
+"""The fallback serializer given to `orjson`, which raises a `TypeError` for the types it does not support."""
+_orjson_default = PriorityQueueEncoder().default
+
+"""The SVG document of a solution, in which the title and the uses of the processors are substituted."""
+_SVG_TEMPLATE = "".join([
+	"<?xml version='1.0' ?>",
+	"<svg xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink' width='100%%' height='100%%' lang='en' version='1.1'>",
+		"<title>%(title)s</title>",  # noqa: E131
+		"<desc>An horizontal chart bar showing the solution to the scheduling problem.</desc>",
+		"<style>",  # https://www.w3.org/TR/SVG2/styling.html
+		"</style>",
+		"<defs>",
+			"<symbol id='cpu' class='cpu'>",  # noqa: E131
+				"<text>CPU</text>",  # noqa: E131
+				"<g class='cores'></g>",
+			"</symbol>",
+			"<symbol id='core' class='core'>",
+				"<text>CORE</text>",
+				"<g class='slices'></g>",
+				"<path y1='0' x1='0' y2='10' x2='10' />",
+				"<marker></marker>",  # <circle cx="6" cy="6" r="3" fill="white" stroke="context-stroke" stroke-width="2"/>
+			"</symbol>",
+			"<symbol id='slice' class='slice'>",
+				"<text>SLICE</text>",
+				"<text>start</text>",
+				"<text>end</text>",
+				"<rect x='100' y='100' width='400' height='200' rx='50' fill='green' />",
+			"</symbol>",
+			"<linearGradient id='background' y2='100%%'>",
+				"<stop offset='5%%' stop-color='rgba(3,126,243,1)' />",
+				"<stop offset='95%%' stop-color='rgba(48,195,158,1)' />",
+			"</linearGradient>",
+		"</defs>",
+		"<rect fill='url(#background)' x='0' y='0' width='100%%' height='100%%' />",
+		"<text x='30%%' y='10%%'>%(title)s</text>",
+		"<g>",
+			"%(uses)s",  # noqa: E131
+		"</g>",
+	"</svg>",
+])
+
+"""The use of a processor in the SVG document of a solution, from its id and vertical position."""
+_SVG_USE = "<use id='cpu_%d' xlink:href='#cpu' x='5%%' y='%d'>%d</use>"
+
 
 # FUNCTIONS ###########################################################################################################
 
 
 @timed_callable("Formatting the solutions to JSON...")
 def _json_format(solution: Solution) -> str:
-	"""Formats a solution into JSON.
+	"""Formats a solution into compact JSON.
+	The solution is serialized by `orjson` if it is installed, and by the standard `json` module otherwise,
+	or if the solution holds integers too wide for `orjson`.
+	Keys are neither sorted nor indented, which keeps the standard `json` module on its C encoder.
 
 	Parameters
 	----------
@@ -36,12 +91,49 @@ def _json_format(solution: Solution) -> str:
 		A `str` representing a JSON `Solution`.
 	"""
 
+	if orjson is not None:
+		try:
+			return orjson.dumps(solution, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+		except orjson.JSONEncodeError:  # integers wider than 64 bits
+			pass
+
+	return dumps(solution, skipkeys=True, cls=PriorityQueueEncoder)
+
+
+@timed_callable("Formatting the solutions to indented JSON...")
+def _json_pretty_format(solution: Solution) -> str:
+	"""Formats a solution into indented JSON, with sorted keys.
+	The solution is serialized by `orjson` if it is installed, and by the standard `json` module otherwise,
+	or if the solution holds integers too wide for `orjson`.
+
+	Parameters
+	----------
+	solution : Solution
+		A `Solution`.
+
+	Returns
+	-------
+	str
+		A `str` representing a JSON `Solution`.
+	"""
+
+	if orjson is not None:
+		try:
+			return orjson.dumps(
+				solution,
+				default=_orjson_default,
+				option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+			).decode()
+		except orjson.JSONEncodeError:  # integers wider than 64 bits
+			pass
+
 	return dumps(solution, skipkeys=True, sort_keys=True, indent=4, cls=PriorityQueueEncoder)
 
 
 @timed_callable("Formatting the solutions to XML...")
 def _xml_format(solution: Solution) -> str:
 	"""Formats a solution into a custom XML schema.
+	The document is written directly with tab indentation, as all the values are integers and need no escaping.
 
 	Parameters
 	----------
@@ -54,19 +146,29 @@ def _xml_format(solution: Solution) -> str:
 		A `str` representing a XML `Solution`.
 	"""
 
-	tables = Element("Tables")
+	buf = StringIO()
+	write = buf.write
+	write('<?xml version="1.0" ?>\n<Tables')
+
+	if not any(cpu.cores for cpu in solution.arch):
+		write("/>\n")
+		return buf.getvalue()
+
+	write(">\n")
 	for cpu in solution.arch:
 		for core in cpu.cores:
-			schedule = SubElement(tables, "Schedule", {"CpuId": str(cpu.id), "CoreId": str(core.id)})
-			schedule.extend([
-				Element("Slice", {
-					"TaskId": str(_slice.task_id),
-					"Start": str(_slice.start),
-					"Duration": str(_slice.end - _slice.start),
-				}) for _slice in core.slices
-			])
+			if not core.slices:
+				write(f'\t<Schedule CpuId="{cpu.id}" CoreId="{core.id}"/>\n')
+				continue
+
+			write(f'\t<Schedule CpuId="{cpu.id}" CoreId="{core.id}">\n')
+			it = iter(core.slices)
+			for task_id, start, duration in zip(it, it, it):
+				write(f'\t\t<Slice TaskId="{task_id}" Start="{start}" Duration="{duration}"/>\n')
+			write("\t</Schedule>\n")
+	write("</Tables>\n")
 
-	return parseString(tostring(tables)).toprettyxml()
+	return buf.getvalue()
 
 
 @timed_callable("Formatting the solution to a raw string representation...")
@@ -90,6 +192,7 @@ def _raw_format(solution: Solution) -> str:
 @timed_callable("Formatting the solution to SVG...")
 def _svg_format(solution: Solution) -> str:
 	"""Formats a solution into SVG.
+	The title is taken from the folder of the test case, and escaped since it is substituted into the markup.
 
 	Parameters
 	----------
@@ -106,49 +209,9 @@ def _svg_format(solution: Solution) -> str:
 		str(solution.filepaths.tsk.parts[-2]) if 0 < len(solution.filepaths.tsk.parts) else str(Path.cwd())
 	)
 
-	svg = fromstringlist([
-		"<?xml version='1.0' ?>",
-		"<svg xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink' width='100%' height='100%' lang='en' version='1.1'>",
-			f"<title>{title}</title>",  # noqa: E131
-			"<desc>An horizontal chart bar showing the solution to the scheduling problem.</desc>",
-			"<style>",  # https://www.w3.org/TR/SVG2/styling.html
-			"</style>",
-			"<defs>",
-				"<symbol id='cpu' class='cpu'>",  # noqa: E131
-					"<text>CPU</text>",  # noqa: E131
-					"<g class='cores'></g>",
-				"</symbol>",
-				"<symbol id='core' class='core'>",
-					"<text>CORE</text>",
-					"<g class='slices'></g>",
-					"<path y1='0' x1='0' y2='10' x2='10' />",
-					"<marker></marker>",  # <circle cx="6" cy="6" r="3" fill="white" stroke="context-stroke" stroke-width="2"/>
-				"</symbol>",
-				"<symbol id='slice' class='slice'>",
-					"<text>SLICE</text>",
-					"<text>start</text>",
-					"<text>end</text>",
-					"<rect x='100' y='100' width='400' height='200' rx='50' fill='green' />",
-				"</symbol>",
-				"<linearGradient id='background' y2='100%'>",
-					"<stop offset='5%' stop-color='rgba(3,126,243,1)' />",
-					"<stop offset='95%' stop-color='rgba(48,195,158,1)' />",
-				"</linearGradient>",
-			"</defs>",
-			"<rect fill='url(#background)' x='0' y='0' width='100%' height='100%' />",
-			f"<text x='30%' y='10%'>{title}</text>",
-			"<g>",
-				"".join(f"<use id='cpu_{cpu.id}' xlink:href='#cpu' x='5%' y='{i * (15 * len(cpu.cores))}'>" + str(cpu.id) + "</use>" for i, cpu in enumerate(solution.arch)),
-			"</g>",
-		"</svg>",
-	])
+	uses = "".join(_SVG_USE % (cpu.id, i * (15 * len(cpu.cores)), cpu.id) for i, cpu in enumerate(solution.arch))
 
-	for cpu in solution.arch:
-		Element("use", {"id": str(cpu.id)})
-		for core in cpu.cores:
-			Element("use", {"id": str(core.id)})
-
-	return tostring(svg)
+	return _SVG_TEMPLATE % {"title": escape(title), "uses": uses}
 
 
 # CLASSES #############################################################################################################
@@ -162,7 +225,9 @@ class OutputFormat(Enum):
 	xml : partial
 		Callable object mapped to a XML formatter (custom module format).
 	json : partial
-		Callable object mapped to a JSON formatter.
+		Callable object mapped to a compact JSON formatter.
+	json_pretty : partial
+		Callable object mapped to an indented JSON formatter, with sorted keys.
 	raw : partial
 		Callable object mapped to a raw formatter (`solution` is converted into a `str`).
 	svg : partial
@@ -172,10 +237,15 @@ class OutputFormat(Enum):
 	-------
 	__call__
 		Converts the enumeration member into the corresponding function call.
+
+	Notes
+	-----
+	The formatters must stay wrapped in `partial`, since functions defined in the class body are not members but methods.
 	"""
 
 	xml: partial = partial(_xml_format)
 	json: partial = partial(_json_format)
+	json_pretty: partial = partial(_json_pretty_format)
 	raw: partial = partial(_raw_format)
 	svg: partial = partial(_svg_format)
 
@@ -193,4 +263,8 @@ class OutputFormat(Enum):
 			A `str` representing a `Solution`.
 		"""
 
-		return self.value(solution)
+		return self.value.func(solution)
+
+
+"""The formatting function of each `OutputFormat` member, by name, to be called directly."""
+FORMATTERS: Dict[str, Callable[[Solution], str]] = {member.name: member.value.func for member in OutputFormat}
@@ -4,6 +4,7 @@
 # IMPORTS #############################################################################################################
 
 import logging
+import sys
 from logging import Handler, LogRecord
 from typing import Any, Dict, NoReturn
 
@@ -45,10 +46,11 @@ class Singleton(type):
 			The single instance of the caller class.
 		"""
 
-		if cls not in cls._instances:
-			cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+		instance = cls._instances.get(cls)
+		if instance is None:
+			instance = cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
 
-		return cls._instances[cls]
+		return instance
 
 
 class ColoredHandler(Handler, metaclass=Singleton):
@@ -69,6 +71,12 @@ class ColoredHandler(Handler, metaclass=Singleton):
 		Verbose mode (default is False).
 	_formatters : Dict[int, logging.Formatter]
 		Holds logging level values as keys and `Formatter` as values (default is dict()).
+	_emitters : Dict[int, Callable[[LogRecord], str]]
+		Holds logging level values as keys and the bound `format` method of the matching `Formatter` as values
+		(default is dict()).
+	_min_level : int
+		The lowest level of the records to print, any level in non-verbose mode being above `logging.WARNING`
+		(default is logging.WARNING + 1).
 
 	Methods
 	-------
@@ -93,6 +101,8 @@ class ColoredHandler(Handler, metaclass=Singleton):
 	_reset = '\033[0m'
 	_verbose = False
 	_formatters = {}
+	_emitters = {}
+	_min_level = logging.WARNING + 1
 
 	def __init__(self: Singleton, verbose: bool = False) -> NoReturn:
 		"""Called after the instance has been created (by `__new__()`), but before it is returned to the caller.
@@ -108,12 +118,14 @@ class ColoredHandler(Handler, metaclass=Singleton):
 		"""
 
 		Handler.__init__(self)
-		logging.getLogger().setLevel(0)
 		__class__._verbose = verbose
+		__class__._min_level = 0 if verbose else logging.WARNING + 1
+		logging.getLogger().setLevel(__class__._min_level)
 		__class__._formatters = {key: logging.Formatter(
 			fmt=value + '[%(asctime)s][%(levelname)s]: %(message)s' + __class__._reset,
 			datefmt='%H:%M:%S',
 		) for key, value in __class__._colors.items()}
+		__class__._emitters = {key: formatter.format for key, formatter in __class__._formatters.items()}
 
 	def emit(self: Singleton, record: LogRecord) -> NoReturn:
 		"""Formats and prints a `LoggerRecord` parameter, depending on the verbosity.
@@ -124,5 +136,5 @@ class ColoredHandler(Handler, metaclass=Singleton):
 			A record to format and print.
 		"""
 
-		if __class__._verbose or 30 < record.levelno:
-			print(__class__._formatters[record.levelno].format(record))
+		if __class__._min_level <= record.levelno:
+			sys.stdout.write(__class__._emitters[record.levelno](record) + "\n")
@@ -25,17 +25,19 @@ OR-Tools
 
 
 import logging
+import os
 from argparse import ArgumentParser
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from time import process_time
-from typing import Callable, List, TypeVar
+from time import perf_counter
+from typing import Callable, Iterable, List, NoReturn, TypeVar
 
 from builder import build
 
 from datatypes import FilepathPair, Problem, Solution
 
-from format import OutputFormat
+from format import FORMATTERS, OutputFormat
 
 from log import ColoredHandler
 
@@ -115,30 +117,74 @@ def _create_cli_parser() -> ArgumentParser:
 	return _add_dataset_arggroup(parser)
 
 
-def _import_files_from_folder(folder_path: Path) -> FilepathPair:
-	"""Creates a filepath pair from a given folder.
+def _pair_filenames(folder_path: Path, filenames: Iterable[str]) -> FilepathPair:
+	"""Creates a filepath pair from the names of the files of a given folder.
 
 	Parameters
 	----------
 	folder_path : Path
-		A `Path` from which build the filepath pair of `*.tsk` and `*.cfg` files.
-		Only the first encountered file of each type is taken, all the others are ignored.
+		The `Path` of the folder containing the files.
+	filenames : Iterable[str]
+		The names of the files of the folder, from which only the first `*.tsk` and `*.cfg` names are taken.
 
 	Returns
 	-------
 	FilepathPair
 		A `FilepathPair` pointing to the `*.tsk` and `*.cfg` files.
+
+	Raises
+	------
+	StopIteration
+		If the names do not contain at least one `*.tsk` and one `*.cfg` file.
 	"""
 
-	tsk = next(filter(Path.is_file, folder_path.glob('*.tsk')))
-	cfg = next(filter(Path.is_file, folder_path.glob('*.cfg')))
+	tsk = cfg = None
+
+	for filename in filenames:
+		if tsk is None and filename.endswith(".tsk"):
+			tsk = folder_path / filename
+		elif cfg is None and filename.endswith(".cfg"):
+			cfg = folder_path / filename
+
+		if tsk is not None and cfg is not None:
+			break
+	else:
+		raise StopIteration
 
 	if tsk.stem != cfg.stem:
-		logging.warning("The names of the files mismatch: '" + tsk.stem + "' and '" + cfg.stem + "'")
+		logging.warning("The names of the files mismatch: '%s' and '%s'", tsk.stem, cfg.stem)
 
 	return FilepathPair(tsk, cfg)
 
 
+def _import_files_from_folder(folder_path: Path) -> FilepathPair:
+	"""Creates a filepath pair from a given folder.
+
+	Parameters
+	----------
+	folder_path : Path
+		A `Path` from which build the filepath pair of `*.tsk` and `*.cfg` files.
+		The folder is scanned once, and only the first encountered file of each type is taken.
+		The cached file type of the directory entries is used, so no additional `stat` call is made for most files.
+
+	Returns
+	-------
+	FilepathPair
+		A `FilepathPair` pointing to the `*.tsk` and `*.cfg` files.
+
+	Raises
+	------
+	StopIteration
+		If the folder does not contain at least one `*.tsk` and one `*.cfg` file.
+	"""
+
+	with os.scandir(folder_path) as entries:
+		return _pair_filenames(
+			folder_path,
+			(entry.name for entry in entries if entry.name.endswith((".tsk", ".cfg")) and entry.is_file()),
+		)
+
+
 def _get_filepath_pairs(folder_path: Path, recursive: bool = False) -> List[FilepathPair]:
 	"""Gathers the filepath pairs from a given folder.
 
@@ -148,7 +194,9 @@ def _get_filepath_pairs(folder_path: Path, recursive: bool = False) -> List[File
 		A `Path` from which build the filepath pairs of`*.tsk` and `*.cfg` files.
 	recursive : bool
 		Toggles the recursive search for cases (default: False).
-		All the folders and subfolders containing at least one `*.tsk` and `*.cfg` file will be taken.
+		All the folders and subfolders containing at least one `*.tsk` and `*.cfg` file will be taken,
+		in a single top-down walk of the directory tree that does not follow symbolic links,
+		picking the files from the names listed by the walk without scanning the folders again.
 
 	Returns
 	-------
@@ -156,19 +204,17 @@ def _get_filepath_pairs(folder_path: Path, recursive: bool = False) -> List[File
 		A list of populated `FilepathPair`.
 	"""
 
-	filepath_pairs = []
-
-	try:
-		filepath_pairs = [_import_files_from_folder(folder_path)]
-	except StopIteration:
-		pass
-
 	if not recursive:
-		return filepath_pairs
+		try:
+			return [_import_files_from_folder(folder_path)]
+		except StopIteration:
+			return []
 
-	for subfolder in filter(lambda e: e.is_dir(), folder_path.iterdir()):
+	filepath_pairs = []
+
+	for folder, _, filenames in os.walk(folder_path):
 		try:
-			filepath_pairs += [filepath for filepath in _get_filepath_pairs(subfolder, True) if filepath]
+			filepath_pairs.append(_pair_filenames(Path(folder), filenames))
 		except StopIteration:
 			pass
 
@@ -179,17 +225,28 @@ T = TypeVar('T', FilepathPair, Problem, Solution)
 U = TypeVar('U', Problem, Solution, str)
 
 
-def _solve(filepath_pair: FilepathPair, pbar: tqdm, operations: List[Callable[[T], U]]) -> str:
+def _init_worker(verbose: bool) -> NoReturn:
+	"""Sets the logging up in a worker process. Forked workers already hold the handler, which is then left as is.
+
+	Parameters
+	----------
+	verbose : bool
+		Toggle the verbosity.
+	"""
+
+	logging.getLogger().addHandler(ColoredHandler(verbose=verbose))
+
+
+def _solve(filepath_pair: FilepathPair, operations: List[Callable[[T], U]]) -> str:
 	"""Handles a test case from building to solving and formatting.
+	Runs in a worker process, so `operations` must only contain module-level functions.
 
 	Parameters
 	----------
 	filepath_pair : FilepathPair
 		A `FilepathPair` pointing to the `*.tsk` and `*.cfg` files.
-	format : OutputFormat
-		A member of `OutputFormat` to use to format the `Solution` of the `Problem`.
-	pbar : tqdm
-		A progress bar to update each time an action of the test case in completed.
+	operations : List[Callable[[T], U]]
+		The functions to apply in sequence to the test case, from building to formatting.
 
 	Returns
 	-------
@@ -201,7 +258,6 @@ def _solve(filepath_pair: FilepathPair, pbar: tqdm, operations: List[Callable[[T
 
 	for function in operations:
 		output = function(output)
-		pbar.update()
 
 	return output
 
@@ -227,17 +283,22 @@ def main() -> int:
 		raise FileNotFoundError("No matching files found. At least one *.tsk file and one *.cfg file are necessary.")
 
 	for filepath_pair in filepath_pairs:
-		logging.info("Files found:\n\t" + filepath_pair.tsk.name + "\n\t" + filepath_pair.cfg.name)
+		logging.info("Files found:\n\t%s\n\t%s", filepath_pair.tsk.name, filepath_pair.cfg.name)
 
-	operations = [build, solve, OutputFormat[args.format[0]]]
+	operations = [build, solve, FORMATTERS[args.format[0]]]
+	# wall-clock time, as the processor time of the main process does not include the one of the workers
+	start = perf_counter()
 
-	with ThreadPoolExecutor(max_workers=len(filepath_pairs)) as executor,\
-		tqdm(total=len(filepath_pairs) * len(operations)) as pbar:
+	with ProcessPoolExecutor(
+		max_workers=min(len(filepath_pairs), os.cpu_count() or 1), initializer=_init_worker, initargs=(args.verbose,),
+	) as executor, tqdm(total=len(filepath_pairs)) as pbar:
 
-		futures = [executor.submit(_solve, filepath_pair, pbar, operations) for filepath_pair in filepath_pairs]
-		results = [future.result() for future in as_completed(futures)]
+		results = []
+		for result in executor.map(_solve, filepath_pairs, repeat(operations), chunksize=1):
+			results.append(result)
+			pbar.update()
 
-		logging.info("Total ellasped time: " + str(process_time()) + "s.")
+		logging.info("Total ellasped time: %ss.", perf_counter() - start)
 
 		exit(results)
 
@@ -5,7 +5,9 @@
 
 
 from fractions import Fraction
-from typing import Callable, Iterable
+from functools import lru_cache, reduce
+from math import gcd
+from typing import Collection, Iterable, Optional
 
 from datatypes import Node
 
@@ -13,62 +15,102 @@ from datatypes import Node
 # FUNCTIONS ###########################################################################################################
 
 
-"""Determine the workload ratio for a node.
+def workload(tasks: Optional[Iterable[Node]]) -> Fraction:
+	"""Determine the workload load carried by an iterable of nodes.
+	The tasks are iterated once, accumulating an integer workload scaled by the hyperperiod of the tasks seen so far,
+	and a single `Fraction` is created from it.
 
-Parameters
-----------
-node : Node
-	A node representing a task.
+	Parameters
+	----------
+	tasks : Optional[Iterable[Node]]
+		An iterable of nodes representing tasks.
 
-Returns
--------
-Fraction
-	The processor workload for the task.
-"""
-process_ratio: Callable[[Node], Fraction] = lambda node: Fraction(node.wcet, node.period)
+	Returns
+	-------
+	Fraction
+		The processor workload, computed from the periods and WCETs of all tasks.
+	"""
 
+	if tasks is None:
+		return 0.0
 
-"""Determine the workload load carried by an iterable of nodes.
+	numerator, period_lcm = 0, 1
+	for node in tasks:
+		lcm = period_lcm * node.period // gcd(period_lcm, node.period)
+		numerator = numerator * (lcm // period_lcm) + node.wcet * (lcm // node.period)
+		period_lcm = lcm
 
-Parameters
-----------
-processes : Iterable[Node]
-	An iterable of nodes representing tasks.
+	return Fraction(numerator, period_lcm)
 
-Returns
--------
-Fraction
-	The processor workload, computed from the periods and WCETs of all tasks.
-"""
-workload: Callable[[Iterable[Node]], Fraction] = lambda tasks:\
-	sum(process_ratio(node) for node in tasks) if tasks is not None else 0.0
 
+def hyperperiod(tasks: Iterable[Node]) -> int:
+	"""Determine the hyperperiod of an iterable of nodes, the least common multiple of their periods.
 
-"""Determine the sufficient condition for schedulability of a count of tasks.
+	Parameters
+	----------
+	tasks : Iterable[Node]
+		An iterable of nodes representing periodic tasks.
 
-Parameters
-----------
-count : int
-	A number of processes.
+	Returns
+	-------
+	int
+		The hyperperiod of the tasks, `1` if there are none.
+	"""
 
-Returns
--------
-Fraction
-	The sufficient workload rate for a count of tasks to be schedulable.
-"""
-sufficient_condition: Callable[[int], Fraction] = lambda count: count * (Fraction(2)**Fraction(1, count) - 1)
+	return reduce(lambda lcm, period: lcm * period // gcd(lcm, period), (node.period for node in tasks), 1)
 
 
-"""Determines whether an iterable of nodes is schedulable or not.
+def scaled_workload(tasks: Iterable[Node], period_lcm: int) -> int:
+	"""Determine the workload carried by an iterable of nodes, as an integer scaled by a hyperperiod.
+	Since the hyperperiod is a multiple of every period, this is exact and orders workloads like `workload` does.
 
-Parameters
-----------
-tasks : Iterable[Node]
-	An iterable of nodes representing periodic tasks.
+	Parameters
+	----------
+	tasks : Iterable[Node]
+		An iterable of nodes representing tasks.
+	period_lcm : int
+		A hyperperiod of the tasks, such as the one of the whole graph.
 
-Returns
--------
-bool
-	Returns 'True' if the tasks are schedulable, and 'False' otherise.
-"""
-is_schedulable: Callable[[Iterable[Node]], bool] = lambda tasks: workload(tasks) <= sufficient_condition(len(tasks))
+	Returns
+	-------
+	int
+		The processor workload multiplied by `period_lcm`.
+	"""
+
+	return sum(node.wcet * (period_lcm // node.period) for node in tasks)
+
+
+@lru_cache(maxsize=None)
+def sufficient_condition(count: int) -> float:
+	"""Determine the sufficient condition for schedulability of a count of tasks.
+
+	Parameters
+	----------
+	count : int
+		A number of processes.
+
+	Returns
+	-------
+	float
+		The sufficient workload rate for a count of tasks to be schedulable.
+		Results are memoized, since task counts take few distinct values.
+	"""
+
+	return count * (2.0 ** (1.0 / count) - 1.0)
+
+
+def is_schedulable(tasks: Collection[Node]) -> bool:
+	"""Determines whether a collection of nodes is schedulable or not.
+
+	Parameters
+	----------
+	tasks : Collection[Node]
+		A collection of nodes representing periodic tasks.
+
+	Returns
+	-------
+	bool
+		Returns 'True' if the tasks are schedulable, and 'False' otherise. No tasks at all are always schedulable.
+	"""
+
+	return not tasks or workload(tasks) <= sufficient_condition(len(tasks))
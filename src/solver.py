@@ -6,12 +6,12 @@
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from fractions import Fraction
-from queue import PriorityQueue
-from typing import Iterable, List, Optional, Tuple
+from heapq import heappop, heappush
+from typing import Dict, List, Tuple
 
-from datatypes import Architecture, Graph, Node, PrioritizedItem, Problem, Processor, Slice, Solution
+from datatypes import Architecture, Graph, Node, PrioritizedItem, Problem, Processor, Solution
 
-from rate_monotonic import workload
+from rate_monotonic import hyperperiod, scaled_workload
 
 from timed import timed_callable
 
@@ -19,28 +19,34 @@ from timed import timed_callable
 # FUNCTIONS ###########################################################################################################
 
 
-def _get_processes_for_core(graph: Graph, core: Tuple[int, int]) -> Optional[Iterable[Node]]:
-	"""Returns an eventual list of processes scheduled on a core.
+def _get_processes_by_core(graph: Graph, cpu: Processor) -> Dict[int, List[Node]]:
+	"""Returns the processes scheduled on the cores of a cpu, indexed by core id.
 
 	Parameters
 	----------
 	graph : Graph
 		An iterable of `Node`.
-	core : Tuple[int, int]
-		A core to look for in the processes' attributes, represented as a tuple.
-		The first member is the cpu id, the second the core id.
+	cpu : Processor
+		A `Processor` whose cores to look for in the processes' attributes.
 
 	Returns
 	-------
-	Optional[List[nodes]] (should be Iterable[ref(Node)])
-		A list of processes if there are any.
+	processes : Dict[int, List[Node]] (should be Dict[int, Iterable[ref(Node)]])
+		A list of processes for each core id of the cpu, built in a single pass over the graph.
 	"""
 
-	return [node for node in graph if node.cpu_id == core[0] and node.core_id == core[1]]
+	processes = {core.id: [] for core in cpu.cores}
+
+	for node in graph:
+		if node.cpu_id == cpu.id and node.core_id in processes:
+			processes[node.core_id].append(node)
+
+	return processes
 
 
-def _get_cpuload(graph: Graph, cpu: Processor) -> Processor:
+def _get_cpuload(graph: Graph, cpu: Processor, period_lcm: int) -> Processor:
 	"""Get the workload carried by the processes scheduled on a cpu, and by core.
+	Workloads are integers scaled by `period_lcm`, so that no `Fraction` is created or normalized.
 
 	Parameters
 	----------
@@ -48,21 +54,46 @@ def _get_cpuload(graph: Graph, cpu: Processor) -> Processor:
 		A `Graph` in which perform the search.
 	cpu : Processor
 		A `Processor`.
+	period_lcm : int
+		The hyperperiod of the graph.
 
 	Returns
 	-------
 	Processor
-		A processor whose workload has been updated (inclusing its cores).
+		The same processor, whose workload has been updated in place (including its cores).
 	"""
 
-	pqueue = PriorityQueue(maxsize=len(cpu.cores))
-	workload_sum = 0.0
+	processes = _get_processes_by_core(graph, cpu)
+	workload_sum = 0
 	for core in cpu.cores:
-		core = core._replace(workload=workload(_get_processes_for_core(graph, (cpu.id, core.id))))
+		core.workload = scaled_workload(processes[core.id], period_lcm)
 		workload_sum += core.workload
-		pqueue.put(PrioritizedItem(core.workload, core.id))
 
-	return cpu._replace(workload=(workload_sum, pqueue))
+	cpu.workload = (workload_sum, _create_core_pqueue(cpu))
+
+	return cpu
+
+
+def _create_core_pqueue(cpu: Processor) -> List[PrioritizedItem]:
+	"""Creates a priority queue for the cores of a cpu, depending on their current workload.
+
+	Parameters
+	----------
+	cpu : Processor
+		A `Processor` whose cores workload is up to date.
+
+	Returns
+	-------
+	core_pqueue : List[PrioritizedItem]
+		A heap, to be used with `heapq`, containing items of core workload and core id.
+	"""
+
+	core_pqueue = []
+
+	for core in cpu.cores:
+		heappush(core_pqueue, PrioritizedItem(core.workload, core.id))
+
+	return core_pqueue
 
 
 def _node_stress(node: Node) -> Fraction:
@@ -82,7 +113,7 @@ def _node_stress(node: Node) -> Fraction:
 	return Fraction(node.period - node.offset, node.wcet)
 
 
-def _create_node_pqueue(graph: Graph, unassigned: bool = True) -> PriorityQueue:
+def _create_node_pqueue(graph: Graph, unassigned: bool = True) -> List[PrioritizedItem]:
 	"""Creates a priority queue for all nodes in the problem, depending on the node stress.
 
 	Parameters
@@ -94,25 +125,27 @@ def _create_node_pqueue(graph: Graph, unassigned: bool = True) -> PriorityQueue:
 
 	Returns
 	-------
-	node_pqueue : PriorityQueue
-		A `PriorityQueue` containing tuples of node stress and node id.
+	node_pqueue : List[PrioritizedItem]
+		A heap, to be used with `heapq`, containing items of node stress and node id.
 	"""
 
-	node_pqueue = PriorityQueue(maxsize=len(graph))
+	node_pqueue = []
 
 	for node in filter(lambda n: n.core_id is None, graph) if unassigned else graph:
-		node_pqueue.put(PrioritizedItem(_node_stress(node), node.id))
+		heappush(node_pqueue, PrioritizedItem(_node_stress(node), node.id))
 
 	return node_pqueue
 
 
-def _update_workload(problem: Problem) -> Problem:
+def _update_workload(problem: Problem, period_lcm: int) -> Problem:
 	"""Updates the processors workload of a problem.
 
 	Parameters
 	----------
 	problem : Problem
 		A `Problem`.
+	period_lcm : int
+		The hyperperiod of the graph of the problem.
 
 	Returns
 	-------
@@ -121,8 +154,8 @@ def _update_workload(problem: Problem) -> Problem:
 	"""
 
 	with ThreadPoolExecutor(max_workers=len(problem.arch)) as executor:
-		futures = [executor.submit(_get_cpuload, problem.graph, cpu) for cpu in problem.arch]
-		problem = problem._replace(arch=[future.result() for future in futures])
+		futures = [executor.submit(_get_cpuload, problem.graph, cpu, period_lcm) for cpu in problem.arch]
+		problem.arch = [future.result() for future in futures]
 
 	return problem
 
@@ -142,19 +175,21 @@ def _color_graphs(problem: Problem) -> List[Tuple[int, Tuple[int, int]]]:
 	"""
 
 	node_pq = _create_node_pqueue(problem.graph)
-	problem = _update_workload(problem)
+	period_lcm = hyperperiod(problem.graph)
+	problem = _update_workload(problem, period_lcm)
 
 	# while node_pq not empty
-	while not node_pq.empty():
+	while node_pq:
 		# get first item of node_pq
-		node_id = node_pq.get_nowait().item
+		node_id = heappop(node_pq).item
 		node = problem.graph[node_id]
 		# add first core to it
-		core = problem.arch[node.cpu_id].workload[1].get_nowait()
-		problem.graph[node.id] = node._replace(core_id=core.item)
-		problem.arch[node.cpu_id].workload[1].put_nowait(core)
-		# reschedule cpu
-		problem.arch[problem.graph[node_id].cpu_id] = _get_cpuload(problem.graph, problem.arch[node.cpu_id])
+		cpu = problem.arch[node.cpu_id]
+		node.core_id = cpu.workload[1][0].item
+		# reschedule cpu, only the chosen core carries more workload so the graph is not scanned again
+		node_workload = scaled_workload((node,), period_lcm)
+		cpu.cores[node.core_id].workload += node_workload
+		cpu.workload = (cpu.workload[0] + node_workload, _create_core_pqueue(cpu))
 
 	return problem
 
@@ -175,14 +210,14 @@ def _generate_solution(problem: Problem) -> Solution:
 
 	node_pq = _create_node_pqueue(problem.graph, False)
 
-	while not node_pq.empty():
-		node_id = node_pq.get_nowait().item
+	while node_pq:
+		node_id = heappop(node_pq).item
 		node = problem.graph[node_id]
 		# assign time slice for each process
-		slices = problem.arch[node.cpu_id].cores[node.core_id].slices
-		# add it to corresponding core, at the end of the list
-		start = 0 if not slices else slices[-1].end + 1
-		problem.arch[node.cpu_id].cores[node.core_id].slices.append(Slice(node.id, start, start + node.wcet))
+		core = problem.arch[node.cpu_id].cores[node.core_id]
+		# add it to corresponding core, at the end of the list, as (task id, start, duration)
+		start = 0 if not core.slices else core.slices[-2] + core.slices[-1] + 1
+		core.slices.extend((node.id, start, node.wcet))
 
 	return Solution(problem.filepaths, _hyperperiod_duration(problem.arch), problem.arch)
 
@@ -201,7 +236,8 @@ def _hyperperiod_duration(arch: Architecture) -> int:
 		The hyperperiod length for the solution.
 	"""
 
-	return max(core.slices[-1].end for cpu in arch for core in cpu.cores if core.slices)
+	# the end of the last slice of each core, from its start and its duration
+	return max(core.slices[-2] + core.slices[-1] for cpu in arch for core in cpu.cores if core.slices)
 
 
 # ENTRY POINT #########################################################################################################
@@ -225,9 +261,9 @@ def solve(problem: Problem) -> Solution:
 	# SOLVE MODEL
 
 	problem = _color_graphs(problem)
-	logging.info("Coloration found for:\t" + str(problem.filepaths))
+	logging.info("Coloration found for:\t%s", problem.filepaths)
 
 	solution = _generate_solution(problem)
-	logging.info("Solution found for:\t" + str(problem.filepaths))
+	logging.info("Solution found for:\t%s", problem.filepaths)
 
 	return solution
@@ -8,8 +8,6 @@ from functools import wraps
 from time import perf_counter
 from typing import Any, Callable, Dict, Optional
 
-import log
-
 
 # FUNCTIONS ###########################################################################################################
 
@@ -44,9 +42,9 @@ def timed_callable(message: str) -> Optional[Any]:
 				result = callable(*args, **kwds)
 				end = perf_counter()
 
-				logging.info("Done in " + str(end - start) + "s.")
+				logging.info("Done in %ss.", end - start)
 			else:
-				log.error("Cannot call timed callable" + str(callable) + ": there is no message.")
+				logging.error("Cannot call timed callable %s: there is no message.", callable)
 
 			return result
 		return timed_wrapper
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# IMPORTS #############################################################################################################
+
+
+import logging
+import sys
+import unittest
+from pathlib import Path
+from typing import NoReturn
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from datatypes import FilepathPair  # noqa: E402
+
+
+# CONSTANTS ###########################################################################################################
+
+
+"""The task file of the test case used throughout the tests."""
+CASE = Path(__file__).resolve().parents[1] / "data" / "Case 1" / "15-3-1-1.tsk"
+
+
+# CLASSES #############################################################################################################
+
+
+class CaseTestCase(unittest.TestCase):
+	"""A test case running on `CASE`, with logging disabled.
+
+	Attributes
+	----------
+	filepath_pair : FilepathPair
+		The `FilepathPair` pointing to the files of `CASE`.
+	"""
+
+	@classmethod
+	def setUpClass(cls: type) -> NoReturn:
+		logging.disable(logging.CRITICAL)
+		cls.filepath_pair = FilepathPair(CASE, CASE.with_suffix(".cfg"))
+
+	@classmethod
+	def tearDownClass(cls: type) -> NoReturn:
+		logging.disable(logging.NOTSET)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# IMPORTS #############################################################################################################
+
+
+import json
+import unittest
+from pathlib import Path
+from typing import NoReturn
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+from builder import build
+
+from datatypes import FilepathPair, Solution, iter_slices
+
+from format import FORMATTERS
+
+from solver import solve
+
+from tests import CaseTestCase
+
+
+# CLASSES #############################################################################################################
+
+
+class TestJsonFormat(CaseTestCase):
+	"""Tests of the JSON formatters, with and without `orjson`."""
+
+	@classmethod
+	def setUpClass(cls: type) -> NoReturn:
+		super().setUpClass()
+		cls.solution = solve(build(cls.filepath_pair))
+
+	def _check(self: unittest.TestCase, document: dict) -> NoReturn:
+		self.assertEqual(document["filepaths"], [str(path) for path in self.solution.filepaths])
+		self.assertEqual(document["hyperperiod"], self.solution.hyperperiod)
+		self.assertEqual(
+			[[[_slice["task_id"], _slice["start"], _slice["duration"]] for _slice in core["slices"]]
+				for cpu in document["arch"] for core in cpu["cores"]],
+			[[list(_slice) for _slice in iter_slices(core)] for cpu in self.solution.arch for core in cpu.cores],
+		)
+
+	def test_json(self: unittest.TestCase) -> NoReturn:
+		for name in ["json", "json_pretty"]:
+			with self.subTest(format=name):
+				self._check(json.loads(FORMATTERS[name](self.solution)))
+				with patch("format.orjson", None):
+					self._check(json.loads(FORMATTERS[name](self.solution)))
+
+
+class TestSvgFormat(CaseTestCase):
+	"""Tests of the SVG formatter."""
+
+	def test_title_escaped(self: unittest.TestCase) -> NoReturn:
+		solution = solve(build(self.filepath_pair))
+		folder = Path("A & <B>")
+		solution = Solution(FilepathPair(folder / "a.tsk", folder / "a.cfg"), solution.hyperperiod, solution.arch)
+
+		document = ElementTree.fromstring(FORMATTERS["svg"](solution).encode())
+
+		self.assertEqual(document.find("{http://www.w3.org/2000/svg}title").text, "Solution for A & <B>")
+
+
+if __name__ == "__main__":
+	unittest.main()
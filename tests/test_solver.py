@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# IMPORTS #############################################################################################################
+
+
+import unittest
+from fractions import Fraction
+from typing import NoReturn
+
+from builder import build
+
+from datatypes import iter_slices
+
+from rate_monotonic import hyperperiod, scaled_workload, workload
+
+from solver import solve
+
+from tests import CaseTestCase
+
+
+# CONSTANTS ###########################################################################################################
+
+
+"""The slices scheduled on each (cpu id, core id) pair of `CASE`, as (task id, start, duration) tuples."""
+_SCHEDULE = {
+	(0, 0): [(4, 0, 357), (2, 358, 568)],
+	(0, 1): [(5, 0, 1627), (8, 1628, 69), (3, 1698, 179)],
+	(0, 2): [(7, 0, 552), (6, 553, 1508)],
+	(1, 0): [(9, 0, 2827)],
+	(1, 1): [(10, 0, 89)],
+	(2, 0): [(12, 0, 875)],
+	(2, 3): [(11, 0, 4710)],
+	(3, 0): [(0, 0, 1)],
+	(3, 2): [(1, 0, 2)],
+}
+
+
+# CLASSES #############################################################################################################
+
+
+class TestSolver(CaseTestCase):
+	"""Tests of the solver and of the workload arithmetic it relies on."""
+
+	def test_schedule(self: unittest.TestCase) -> NoReturn:
+		solution = solve(build(self.filepath_pair))
+
+		self.assertEqual(solution.hyperperiod, 4710)
+		self.assertEqual(
+			{
+				(cpu.id, core.id): [tuple(_slice) for _slice in iter_slices(core)]
+				for cpu in solution.arch for core in cpu.cores if core.slices
+			},
+			_SCHEDULE,
+		)
+
+	def test_scaled_workload(self: unittest.TestCase) -> NoReturn:
+		graph = build(self.filepath_pair).graph
+		period_lcm = hyperperiod(graph)
+
+		for tasks in [graph, graph[:1], graph[::2], []]:
+			with self.subTest(tasks=[node.id for node in tasks]):
+				expected = sum((Fraction(node.wcet, node.period) for node in tasks), Fraction(0))
+				self.assertEqual(workload(tasks), expected)
+				self.assertEqual(Fraction(scaled_workload(tasks, period_lcm), period_lcm), expected)
+
+
+if __name__ == "__main__":
+	unittest.main()